@@ -0,0 +1,18 @@
+# Frozen-module manifest for building cipher-tan into custom firmware.
+#
+# Freezing main.py puts its bytecode and qstrs in ROM: the parser never
+# runs at boot and the code objects stop counting against the GC heap,
+# leaving more RAM for the entropy pool and ring buffers. opt=3 strips
+# asserts and line numbers for a smaller code object.
+#
+# Usage (from a micropython checkout, ESP32_GENERIC_S3 port):
+#   make -C ports/esp32 BOARD=ESP32_GENERIC_S3 \
+#       FROZEN_MANIFEST=/path/to/entropic-chaos/manifest.py
+#
+# Plain "copy main.py to the board" deployment keeps working without
+# this; it's an optional build-time optimization.
+
+include("$(PORT_DIR)/boards/manifest.py")
+# Paths resolve relative to this manifest's directory, so the repo can
+# live anywhere
+freeze(".", "main.py", opt=3)